@@ -9,13 +9,36 @@ Author: PlatinumData Team
 Date: 2025-08-16
 """
 
+import asyncio
 import logging
-import json
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-import requests
+import queue
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import aclosing
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional, Any, AsyncIterator, Awaitable, Callable, Tuple, Union
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import aiohttp
+import orjson
+from tenacity import (
+    RetryCallState,
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from google.api_core.exceptions import Aborted, DeadlineExceeded
+from google.api_core.retry import Retry, if_exception_type
+from google.api_core.retry_async import AsyncRetry
 from google.cloud import firestore
-from dataclasses import dataclass
+from google.cloud.firestore import SERVER_TIMESTAMP
+from dataclasses import dataclass, field, fields
 
 # Configure logging
 logging.basicConfig(
@@ -24,8 +47,156 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Firestore caps a single WriteBatch at 500 operations
+BATCH_SIZE = 500
+
+# Default number of batch commits kept in flight at once
+DEFAULT_MAX_WORKERS = 10
+
+# Maximum leads buffered between the scrape/enrich producers and the writer
+WRITE_QUEUE_SIZE = 10_000
+
+# Seconds the writer waits for more leads before flushing a partial batch
+WRITER_IDLE_FLUSH = 0.5
+
+# Sentinel telling the writer thread that no more leads will be queued
+_QUEUE_DONE = object()
+
+# User-Agent sent with every outbound scraping request
+USER_AGENT = 'PlatinumDataLeadScraper/1.0'
+
+# HTTP connection pool limits (total and per host)
+HTTP_CONNECTION_LIMIT = 64
+HTTP_CONNECTION_LIMIT_PER_HOST = 8
+
+# Maximum number of page fetches in flight per scrape
+SCRAPE_CONCURRENCY = 32
+
+# URLs scheduled together per chunk; bounds pending tasks on large scrapes
+SCRAPE_CHUNK_SIZE = 200
+
+# Per-request timeout in seconds
+REQUEST_TIMEOUT = 10
+
+# Largest response body read from a scraped page; bigger pages are rejected
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+RESPONSE_CHUNK_BYTES = 64 * 1024
+
+# Fetch retry policy: jittered exponential back-off on throttling, server
+# errors and connection failures, honoring Retry-After up to the max wait
+FETCH_MAX_ATTEMPTS = 5
+FETCH_BACKOFF_INITIAL = 1
+FETCH_BACKOFF_MAX = 30
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Minimum spacing between requests to the same host, +/- random jitter
+HOST_REQUEST_INTERVAL = 10.0
+HOST_REQUEST_JITTER = 2.0
+
+# Basic email shape: local part, '@', and a domain containing a dot
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+# Separator characters stripped from phone numbers before counting digits
+_PHONE_STRIP = str.maketrans('', '', '-() ')
+
+# Retry transient commit failures; auto-ID document writes are idempotent
+COMMIT_RETRY = Retry(predicate=if_exception_type(Aborted, DeadlineExceeded))
+ASYNC_COMMIT_RETRY = AsyncRetry(predicate=if_exception_type(Aborted, DeadlineExceeded))
+
+
+def chunks(items: List[Any], size: int):
+    """Yield successive slices of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _as_completed_chunked(coro_fn: Callable[[Any], Awaitable[Any]], items: List[Any],
+                                chunk_size: int) -> AsyncIterator[Tuple[Any, Any]]:
+    """
+    Run ``coro_fn`` over ``items`` one bounded chunk at a time.
+    
+    At most ``chunk_size`` tasks are scheduled at once, and each result is
+    yielded as soon as its task finishes. Exceptions are yielded in place
+    of results, so one failing item does not discard the rest of its chunk.
+    
+    Args:
+        coro_fn: Coroutine function applied to each item
+        items: Items to process
+        chunk_size: Maximum number of tasks scheduled at once
+        
+    Yields:
+        Tuple[Any, Any]: An item and its result or exception
+    """
+    async def run(item: Any) -> Tuple[Any, Any]:
+        try:
+            return item, await coro_fn(item)
+        except Exception as e:
+            return item, e
+    
+    for chunk in chunks(items, chunk_size):
+        tasks = [asyncio.ensure_future(run(item)) for item in chunk]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding tasks if the consumer exits early
+            for task in tasks:
+                task.cancel()
+
 
-@dataclass
+class RetryableHTTPError(aiohttp.ClientError):
+    """Raised for HTTP responses that are worth retrying (429/5xx)."""
+    
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class ResponseTooLargeError(aiohttp.ClientError):
+    """Raised when a response body exceeds MAX_RESPONSE_BYTES."""
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+    
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+        
+    Returns:
+        Optional[float]: Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_fetch_backoff = wait_exponential_jitter(initial=FETCH_BACKOFF_INITIAL, max=FETCH_BACKOFF_MAX)
+
+
+def _fetch_wait(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After if given, else back off exponentially."""
+    error = retry_state.outcome.exception()
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after is not None:
+        return min(retry_after, FETCH_BACKOFF_MAX)
+    return _fetch_backoff(retry_state)
+
+
+@dataclass(slots=True)
 class Lead:
     """Data class representing a lead record."""
     name: str
@@ -38,6 +209,81 @@ class Lead:
     enriched_data: Optional[Dict[str, Any]] = None
 
 
+# Lead field names, resolved once for building Firestore documents
+_LEAD_FIELDS = tuple(f.name for f in fields(Lead))
+
+
+def _email_key(lead: Lead) -> str:
+    """Normalize a lead's email for duplicate detection."""
+    return lead.email.strip().lower()
+
+
+@dataclass(slots=True)
+class WriteResults:
+    """
+    Outcome counters and failures for a Firestore write.
+    
+    Failures are kept as parallel name/reason columns and only formatted
+    into messages when reported. A reason is either the list of validation
+    errors for a lead or the message of its batch commit error, shared by
+    every lead in that batch. Exceptions are not kept, since their
+    tracebacks would pin the failed batch and its documents in memory.
+    """
+    successful: int = 0
+    failed: int = 0
+    skipped: int = 0
+    failed_names: List[str] = field(default_factory=list)
+    failed_reasons: List[Union[List[str], str]] = field(default_factory=list)
+    
+    def record_failure(self, name: str, reason: Union[List[str], str]) -> None:
+        """
+        Record one failed lead.
+        
+        Args:
+            name: Name of the lead that failed
+            reason: Validation errors or the commit error message
+        """
+        self.failed += 1
+        self.failed_names.append(name)
+        self.failed_reasons.append(reason)
+    
+    def merge(self, other: 'WriteResults') -> None:
+        """
+        Add another write's results into this one.
+        
+        Args:
+            other: Results to merge in
+        """
+        self.successful += other.successful
+        self.failed += other.failed
+        self.skipped += other.skipped
+        self.failed_names.extend(other.failed_names)
+        self.failed_reasons.extend(other.failed_reasons)
+    
+    @property
+    def errors(self) -> List[str]:
+        """Formatted error message for each failed lead."""
+        return [
+            f"Validation failed for {name}: {', '.join(reason)}"
+            if isinstance(reason, list) else f"Error writing {name}: {reason}"
+            for name, reason in zip(self.failed_names, self.failed_reasons)
+        ]
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Build the serializable report of this write.
+        
+        Returns:
+            Dict[str, Any]: Counters and formatted error messages
+        """
+        return {
+            'successful': self.successful,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'errors': self.errors
+        }
+
+
 class LeadValidator:
     """Validates lead data before processing."""
     
@@ -53,10 +299,9 @@ class LeadValidator:
             bool: True if email is valid, False otherwise
         """
         # TODO: Implement comprehensive email validation
-        # - Check for valid email format using regex
         # - Validate domain exists
         # - Check against disposable email providers
-        return '@' in email and '.' in email.split('@')[1]
+        return email is not None and _EMAIL_RE.fullmatch(email) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
@@ -75,9 +320,10 @@ class LeadValidator:
         # - Validate country codes
         if not phone:
             return True  # Phone is optional
-        return len(phone.replace('-', '').replace(' ', '').replace('(', '').replace(')', '')) >= 10
+        return len(phone.translate(_PHONE_STRIP)) >= 10
     
-    def validate_lead(self, lead: Lead) -> tuple[bool, List[str]]:
+    @classmethod
+    def validate_lead(cls, lead: Lead) -> tuple[bool, List[str]]:
         """
         Validate a complete lead record.
         
@@ -92,10 +338,10 @@ class LeadValidator:
         if not lead.name or len(lead.name.strip()) == 0:
             errors.append("Name is required")
         
-        if not self.validate_email(lead.email):
+        if not cls.validate_email(lead.email):
             errors.append("Invalid email format")
         
-        if lead.phone and not self.validate_phone(lead.phone):
+        if lead.phone and not cls.validate_phone(lead.phone):
             errors.append("Invalid phone number format")
         
         return len(errors) == 0, errors
@@ -104,16 +350,53 @@ class LeadValidator:
 class LeadScraper:
     """Main class for scraping lead data from various sources."""
     
-    def __init__(self, firestore_client: Optional[firestore.Client] = None):
+    def __init__(self, firestore_client: Optional[firestore.Client] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 async_firestore_client: Optional[firestore.AsyncClient] = None):
         """
         Initialize the LeadScraper.
         
         Args:
             firestore_client: Optional Firestore client instance
+            max_workers: Maximum number of batch commits run in parallel
+            async_firestore_client: Optional async Firestore client used by
+                write_to_firestore_async; created on first use if omitted
         """
         self.db = firestore_client or firestore.Client()
-        self.validator = LeadValidator()
+        self.max_workers = max_workers
+        self.async_db = async_firestore_client
         self.collection_name = 'leads'
+        # Normalized emails committed or staged in an in-flight batch, for
+        # deduplication across concurrent writes; guarded by _emails_lock
+        self._claimed_emails = set()
+        self._emails_lock = threading.Lock()
+        # Monotonic time of the latest request slot reserved per host
+        self._last_request_time = defaultdict(float)
+        # Source type -> async iterator of scraped lead chunks
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], AsyncIterator[List[Lead]]]] = {
+            'linkedin': self._iter_linkedin_leads,
+            'website': self._iter_website_source_leads,
+        }
+    
+    @staticmethod
+    def _create_http_session() -> aiohttp.ClientSession:
+        """
+        Create a pooled HTTP session shared by all fetches of one scrape.
+        
+        Must be called from within a running event loop.
+        
+        Returns:
+            aiohttp.ClientSession: Session with keep-alive connection pooling
+        """
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={'User-Agent': USER_AGENT}
+        )
         
     def scrape_linkedin_leads(self, search_params: Dict[str, str]) -> List[Lead]:
         """
@@ -149,16 +432,68 @@ class LeadScraper:
         logger.info(f"Scraped {len(sample_leads)} leads from LinkedIn")
         return sample_leads
     
-    def scrape_website_leads(self, website_url: str) -> List[Lead]:
+    async def scrape_website_leads(self, website_urls: List[str]) -> List[Lead]:
         """
-        Scrape leads from a company website (placeholder implementation).
+        Scrape leads from company websites (placeholder implementation).
         
         Args:
-            website_url: URL of the website to scrape
+            website_urls: URLs of the websites to scrape
             
         Returns:
             List[Lead]: List of scraped leads
         """
+        leads = []
+        async for page_leads in self.iter_website_leads(website_urls):
+            leads.extend(page_leads)
+        
+        logger.info(f"Scraped {len(leads)} leads from {len(website_urls)} websites")
+        return leads
+    
+    async def iter_website_leads(self, website_urls: List[str]) -> AsyncIterator[List[Lead]]:
+        """
+        Scrape company websites, yielding each page's leads.
+        
+        URLs are scheduled in chunks of SCRAPE_CHUNK_SIZE over one pooled
+        session, with at most SCRAPE_CONCURRENCY requests in flight. Each
+        page's leads are yielded as soon as that page completes.
+        
+        Args:
+            website_urls: URLs of the websites to scrape
+            
+        Yields:
+            List[Lead]: Leads scraped from one website
+        """
+        logger.info(f"Starting website scraping for {len(website_urls)} URLs")
+        
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+        async with self._create_http_session() as session:
+            pages = _as_completed_chunked(
+                lambda url: self._scrape_page(session, semaphore, url),
+                website_urls,
+                SCRAPE_CHUNK_SIZE
+            )
+            # Close the chunk iterator promptly on early exit so its
+            # outstanding fetches are cancelled before the session closes
+            async with aclosing(pages):
+                async for url, page_leads in pages:
+                    if isinstance(page_leads, Exception):
+                        logger.error(f"Error scraping website {url}: {page_leads}")
+                        continue
+                    yield page_leads
+    
+    async def _scrape_page(self, session: aiohttp.ClientSession,
+                           semaphore: asyncio.Semaphore, website_url: str) -> List[Lead]:
+        """
+        Scrape leads from a single company website.
+        
+        Args:
+            session: HTTP session to fetch with
+            semaphore: Semaphore bounding concurrent fetches
+            website_url: URL of the website to scrape
+            
+        Returns:
+            List[Lead]: List of scraped leads, empty if the fetch failed
+        """
         # TODO: Implement website scraping logic
         # - Parse website for contact information
         # - Extract team/about pages
@@ -170,8 +505,8 @@ class LeadScraper:
         
         # Placeholder implementation
         try:
-            response = requests.get(website_url, timeout=10)
-            # TODO: Parse response and extract lead data
+            html = await self._fetch(session, semaphore, website_url)
+            # TODO: Parse html and extract lead data
             
             sample_leads = [
                 Lead(
@@ -186,42 +521,140 @@ class LeadScraper:
             logger.info(f"Scraped {len(sample_leads)} leads from website")
             return sample_leads
             
-        except requests.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error scraping website {website_url}: {e}")
             return []
     
-    def enrich_lead_data(self, lead: Lead) -> Lead:
+    @retry(
+        stop=stop_after_attempt(FETCH_MAX_ATTEMPTS),
+        wait=_fetch_wait,
+        retry=retry_if_exception_type(
+            (aiohttp.ClientConnectionError, asyncio.TimeoutError, RetryableHTTPError)
+        ),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _fetch(self, session: aiohttp.ClientSession,
+                     semaphore: asyncio.Semaphore, url: str) -> str:
+        """
+        Fetch a page body, retrying transient failures with back-off.
+        
+        Args:
+            session: HTTP session to fetch with
+            semaphore: Semaphore bounding concurrent fetches
+            url: URL to fetch
+            
+        Returns:
+            str: Response body
+            
+        Raises:
+            aiohttp.ClientError: If the request fails after all retries
+            ResponseTooLargeError: If the body exceeds MAX_RESPONSE_BYTES
+        """
+        await self._wait_for_host(url)
+        
+        async with semaphore:
+            async with session.get(url) as response:
+                if response.status in RETRY_STATUSES:
+                    raise RetryableHTTPError(
+                        url,
+                        response.status,
+                        _parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                response.raise_for_status()
+                body = await self._read_capped(response, url)
+                return body.decode(response.charset or 'utf-8', errors='replace')
+    
+    @staticmethod
+    async def _read_capped(response: aiohttp.ClientResponse, url: str) -> bytes:
+        """
+        Stream a response body, aborting once it exceeds MAX_RESPONSE_BYTES.
+        
+        Args:
+            response: Response whose body has not been read yet
+            url: URL the response came from, for error messages
+            
+        Returns:
+            bytes: Response body
+            
+        Raises:
+            ResponseTooLargeError: If the body exceeds MAX_RESPONSE_BYTES
+        """
+        if response.content_length is not None and response.content_length > MAX_RESPONSE_BYTES:
+            raise ResponseTooLargeError(
+                f"Response from {url} is {response.content_length} bytes, "
+                f"limit is {MAX_RESPONSE_BYTES}"
+            )
+        
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(RESPONSE_CHUNK_BYTES):
+            body += chunk
+            if len(body) > MAX_RESPONSE_BYTES:
+                raise ResponseTooLargeError(
+                    f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes"
+                )
+        return bytes(body)
+    
+    async def _wait_for_host(self, url: str) -> None:
         """
-        Enrich lead data with additional information.
+        Sleep until this request's politeness slot for its host comes up.
+        
+        Slots are reserved without awaiting, so concurrent fetches to the
+        same host queue up HOST_REQUEST_INTERVAL (+/- jitter) apart.
         
         Args:
-            lead: Lead object to enrich
+            url: URL about to be requested
+        """
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        interval = HOST_REQUEST_INTERVAL + random.uniform(-HOST_REQUEST_JITTER, HOST_REQUEST_JITTER)
+        
+        last = self._last_request_time[host]
+        slot = now if not last else max(now, last + interval)
+        self._last_request_time[host] = slot
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def enrich_lead_data(self, leads: List[Lead], now: Optional[datetime] = None) -> List[Lead]:
+        """
+        Enrich a batch of leads with additional information.
+        
+        Leads are enriched together so a provider's bulk endpoint can serve
+        the whole batch in one request.
+        
+        Args:
+            leads: Lead objects to enrich
+            now: Batch timestamp to record as enriched_at; defaults to now
             
         Returns:
-            Lead: Enriched lead object
+            List[Lead]: Enriched lead objects
         """
         # TODO: Implement data enrichment logic
         # - Use APIs like Clearbit, ZoomInfo, or Hunter.io
+        # - Submit [lead.email for lead in leads] to the bulk endpoint
         # - Add social media profiles
         # - Get company information and funding data
         # - Add industry and company size data
         # - Verify and update contact information
         
-        logger.info(f"Enriching data for lead: {lead.name}")
+        logger.info(f"Enriching data for {len(leads)} leads")
         
         # Placeholder enrichment
-        if not lead.enriched_data:
-            lead.enriched_data = {}
-        
-        lead.enriched_data.update({
-            'enriched_at': datetime.now().isoformat(),
-            'data_sources': ['placeholder_api'],
-            'confidence_score': 0.85
-        })
+        enriched_at = (now or datetime.now()).isoformat()
+        for lead in leads:
+            if not lead.enriched_data:
+                lead.enriched_data = {}
+            
+            lead.enriched_data.update({
+                'enriched_at': enriched_at,
+                'data_sources': ['placeholder_api'],
+                'confidence_score': 0.85
+            })
         
-        return lead
+        return leads
     
-    def write_to_firestore(self, leads: List[Lead]) -> Dict[str, Any]:
+    def write_to_firestore(self, leads: List[Lead]) -> WriteResults:
         """
         Write validated leads to Firestore.
         
@@ -229,109 +662,324 @@ class LeadScraper:
             leads: List of Lead objects to write
             
         Returns:
-            Dict[str, Any]: Results of the write operation
+            WriteResults: Results of the write operation
         """
-        results = {
-            'successful': 0,
-            'failed': 0,
-            'errors': []
-        }
+        results = WriteResults()
+        batches = self._build_batches(self.db, leads, results)
+        
+        # Commit batches concurrently; results are only updated on this thread
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(batch.commit, retry=COMMIT_RETRY): chunk
+                for batch, chunk in batches
+            }
+            
+            for future in as_completed(futures):
+                self._record_commit(results, futures[future], future.exception())
         
+        logger.info(f"Firestore write results: {results.successful} successful, "
+                    f"{results.failed} failed, {results.skipped} skipped")
+        return results
+    
+    async def write_to_firestore_async(self, leads: List[Lead]) -> WriteResults:
+        """
+        Write validated leads to Firestore using the async client.
+        
+        All batch commits are awaited concurrently and multiplexed over the
+        async client's single channel. The async client is bound to the event
+        loop it is first used on.
+        
+        Args:
+            leads: List of Lead objects to write
+            
+        Returns:
+            WriteResults: Results of the write operation
+        """
+        if self.async_db is None:
+            self.async_db = firestore.AsyncClient()
+        
+        results = WriteResults()
+        batches = self._build_batches(self.async_db, leads, results)
+        
+        outcomes = await asyncio.gather(
+            *[batch.commit(retry=ASYNC_COMMIT_RETRY) for batch, _ in batches],
+            return_exceptions=True
+        )
+        for (_, chunk), outcome in zip(batches, outcomes):
+            error = outcome if isinstance(outcome, BaseException) else None
+            self._record_commit(results, chunk, error)
+        
+        logger.info(f"Firestore write results: {results.successful} successful, "
+                    f"{results.failed} failed, {results.skipped} skipped")
+        return results
+    
+    def _build_batches(self, db: Any, leads: List[Lead],
+                       results: WriteResults) -> List[Tuple[Any, List[Lead]]]:
+        """
+        Validate leads and stage them into write batches.
+        
+        Each lead's email is claimed when it is staged, so a lead whose email
+        was already written, or is staged by this or a concurrent write, is
+        counted as skipped instead of being written again.
+        
+        Args:
+            db: Firestore client (sync or async) to build batches from
+            leads: List of Lead objects to write
+            results: Write results, updated with validation failures and skips
+            
+        Returns:
+            List[Tuple[Any, List[Lead]]]: Uncommitted batches with their leads
+        """
+        # Validate and deduplicate up front so batches only carry writable documents
+        valid_leads = []
         for lead in leads:
-            try:
-                # Validate lead before writing
-                is_valid, errors = self.validator.validate_lead(lead)
-                
-                if not is_valid:
-                    results['failed'] += 1
-                    results['errors'].append(f"Validation failed for {lead.name}: {', '.join(errors)}")
+            is_valid, errors = LeadValidator.validate_lead(lead)
+            
+            if not is_valid:
+                results.record_failure(lead.name, errors)
+                continue
+            
+            valid_leads.append(lead)
+        
+        # Claim emails in one step so concurrent writers cannot both stage one
+        claimed_leads = []
+        with self._emails_lock:
+            for lead in valid_leads:
+                key = _email_key(lead)
+                if key in self._claimed_emails:
+                    results.skipped += 1
                     continue
                 
-                # Convert lead to dictionary for Firestore
-                lead_data = {
-                    'name': lead.name,
-                    'email': lead.email,
-                    'company': lead.company,
-                    'phone': lead.phone,
-                    'title': lead.title,
-                    'source': lead.source,
-                    'scraped_at': lead.scraped_at,
-                    'enriched_data': lead.enriched_data,
-                    'created_at': datetime.now(),
-                    'updated_at': datetime.now()
-                }
-                
-                # Write to Firestore
-                doc_ref = self.db.collection(self.collection_name).document()
-                doc_ref.set(lead_data)
-                
-                results['successful'] += 1
-                logger.info(f"Successfully wrote lead {lead.name} to Firestore")
+                self._claimed_emails.add(key)
+                claimed_leads.append(lead)
+        
+        try:
+            collection = db.collection(self.collection_name)
+            
+            # Build one WriteBatch per chunk of up to BATCH_SIZE leads
+            batches = []
+            for chunk in chunks(claimed_leads, BATCH_SIZE):
+                batch = db.batch()
                 
-                # TODO: Implement compliance logging
-                # - Log data processing activities
-                # - Track consent and opt-out requests
-                # - Maintain audit trail for GDPR/CCPA compliance
-                # - Log data retention and deletion activities
+                for lead in chunk:
+                    # Convert lead to dictionary for Firestore
+                    lead_data = {name: getattr(lead, name) for name in _LEAD_FIELDS}
+                    # Server-evaluated sentinel: no clock skew, smaller payload
+                    lead_data['created_at'] = lead_data['updated_at'] = SERVER_TIMESTAMP
+                    batch.set(collection.document(), lead_data)
                 
-            except Exception as e:
-                results['failed'] += 1
-                results['errors'].append(f"Error writing {lead.name}: {str(e)}")
-                logger.error(f"Error writing lead {lead.name} to Firestore: {e}")
+                batches.append((batch, chunk))
+        except BaseException:
+            self._release_emails(claimed_leads)
+            raise
         
-        logger.info(f"Firestore write results: {results['successful']} successful, {results['failed']} failed")
-        return results
+        return batches
+    
+    def _release_emails(self, leads: List[Lead]) -> None:
+        """
+        Release email claims for leads that were not written.
+        
+        Args:
+            leads: Leads whose claims were taken by _build_batches
+        """
+        with self._emails_lock:
+            self._claimed_emails.difference_update(_email_key(lead) for lead in leads)
+    
+    def _record_commit(self, results: WriteResults, chunk: List[Lead],
+                       error: Optional[BaseException]) -> None:
+        """
+        Record the outcome of one batch commit.
+        
+        Args:
+            results: Write results to update
+            chunk: Leads staged in the committed batch
+            error: Exception raised by the commit, or None on success
+        """
+        if error is None:
+            results.successful += len(chunk)
+            logger.info(f"Successfully wrote batch of {len(chunk)} leads to Firestore")
+            
+            # TODO: Implement compliance logging
+            # - Log data processing activities
+            # - Track consent and opt-out requests
+            # - Maintain audit trail for GDPR/CCPA compliance
+            # - Log data retention and deletion activities
+            return
+        
+        # A batch commits atomically, so every lead in the chunk failed and
+        # may be retried by a later write
+        self._release_emails(chunk)
+        reason = str(error)
+        for lead in chunk:
+            results.record_failure(lead.name, reason)
+        logger.error(f"Error writing batch of {len(chunk)} leads to Firestore: {error}")
     
-    def process_lead_batch(self, source_type: str, source_params: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_lead_batch(self, source_type: str, source_params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process a batch of leads from a specific source.
         
+        Scraping, enrichment and writing run as a pipeline: leads are queued
+        as soon as their page is scraped and enriched, while a single writer
+        thread drains the queue into Firestore batch commits.
+        
         Args:
             source_type: Type of source ('linkedin', 'website', etc.)
-            source_params: Parameters specific to the source
+            source_params: Parameters specific to the source ('url' or
+                'urls' for websites)
             
         Returns:
             Dict[str, Any]: Processing results
         """
         logger.info(f"Processing lead batch from {source_type}")
         
+        # One timestamp shared by every lead enriched and written in this batch
+        batch_now = datetime.now()
+        batch_iso = batch_now.isoformat()
+        
+        lead_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        write_results = WriteResults()
+        writer = threading.Thread(
+            target=self._writer_loop,
+            args=(lead_queue, write_results),
+            daemon=True
+        )
+        writer.start()
+        
+        total_scraped = 0
+        total_enriched = 0
+        error = None
+        
         try:
-            # Scrape leads based on source type
-            if source_type == 'linkedin':
-                leads = self.scrape_linkedin_leads(source_params)
-            elif source_type == 'website':
-                leads = self.scrape_website_leads(source_params.get('url', ''))
-            else:
-                raise ValueError(f"Unsupported source type: {source_type}")
-            
-            # Enrich lead data
-            enriched_leads = []
-            for lead in leads:
+            async for leads in self._iter_source_leads(source_type, source_params):
+                total_scraped += len(leads)
+                
+                # Enrich lead data
                 try:
-                    enriched_lead = self.enrich_lead_data(lead)
-                    enriched_leads.append(enriched_lead)
+                    leads = self.enrich_lead_data(leads, now=batch_now)
                 except Exception as e:
-                    logger.error(f"Error enriching lead {lead.name}: {e}")
-                    enriched_leads.append(lead)  # Add without enrichment
-            
-            # Write to Firestore
-            write_results = self.write_to_firestore(enriched_leads)
-            
-            return {
-                'source_type': source_type,
-                'total_scraped': len(leads),
-                'total_enriched': len(enriched_leads),
-                'write_results': write_results,
-                'timestamp': datetime.now().isoformat()
-            }
+                    logger.error(f"Error enriching {len(leads)} leads: {e}")
+                    # Queue without enrichment
+                
+                total_enriched += len(leads)
+                for lead in leads:
+                    await self._enqueue(lead_queue, lead)
             
         except Exception as e:
             logger.error(f"Error processing lead batch: {e}")
+            error = e
+        
+        finally:
+            # Wait for the writer to flush everything queued so far, even if
+            # scraping failed, so partial writes are reported and not cut off
+            await self._enqueue(lead_queue, _QUEUE_DONE)
+            await asyncio.to_thread(writer.join)
+        
+        if error is not None:
             return {
                 'source_type': source_type,
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'error': str(error),
+                'write_results': write_results.as_dict(),
+                'timestamp': batch_iso
             }
+        
+        return {
+            'source_type': source_type,
+            'total_scraped': total_scraped,
+            'total_enriched': total_enriched,
+            'write_results': write_results.as_dict(),
+            'timestamp': batch_iso
+        }
+    
+    async def _iter_source_leads(self, source_type: str,
+                                 source_params: Dict[str, Any]) -> AsyncIterator[List[Lead]]:
+        """
+        Scrape leads from a source, yielding them in chunks as they arrive.
+        
+        Args:
+            source_type: Type of source ('linkedin', 'website', etc.)
+            source_params: Parameters specific to the source
+            
+        Yields:
+            List[Lead]: Leads scraped from one page or request
+        """
+        handler = self._handlers.get(source_type)
+        if handler is None:
+            raise ValueError(f"Unsupported source type: {source_type}")
+        
+        async for leads in handler(source_params):
+            yield leads
+    
+    async def _iter_linkedin_leads(self, source_params: Dict[str, Any]) -> AsyncIterator[List[Lead]]:
+        """Yield LinkedIn leads as a single chunk."""
+        yield self.scrape_linkedin_leads(source_params)
+    
+    async def _iter_website_source_leads(self, source_params: Dict[str, Any]) -> AsyncIterator[List[Lead]]:
+        """Yield website leads per page for the 'url' or 'urls' parameter."""
+        urls = source_params.get('urls') or [source_params.get('url', '')]
+        async for leads in self.iter_website_leads(urls):
+            yield leads
+    
+    @staticmethod
+    async def _enqueue(lead_queue: queue.Queue, item: Any) -> None:
+        """
+        Put an item on the writer queue without blocking the event loop.
+        
+        Args:
+            lead_queue: Queue drained by the writer thread
+            item: Lead or _QUEUE_DONE sentinel
+        """
+        try:
+            lead_queue.put_nowait(item)
+        except queue.Full:
+            # Back-pressure: wait for the writer on a worker thread
+            await asyncio.to_thread(lead_queue.put, item)
+    
+    def _writer_loop(self, lead_queue: queue.Queue, results: WriteResults) -> None:
+        """
+        Drain queued leads into Firestore until the done sentinel arrives.
+        
+        Each drain collects enough leads to give every commit worker a full
+        batch, or flushes early once the queue has been idle for
+        WRITER_IDLE_FLUSH seconds.
+        
+        Args:
+            lead_queue: Queue of leads fed by the scrape/enrich producers
+            results: Write results, accumulated across drains
+        """
+        drain_size = BATCH_SIZE * self.max_workers
+        done = False
+        
+        while not done:
+            pending = []
+            item = lead_queue.get()
+            
+            while True:
+                if item is _QUEUE_DONE:
+                    done = True
+                    break
+                
+                pending.append(item)
+                if len(pending) >= drain_size:
+                    break
+                
+                try:
+                    item = lead_queue.get(timeout=WRITER_IDLE_FLUSH)
+                except queue.Empty:
+                    break
+            
+            if not pending:
+                continue
+            
+            try:
+                drain_results = self.write_to_firestore(pending)
+            except Exception as e:
+                logger.error(f"Error writing {len(pending)} queued leads to Firestore: {e}")
+                drain_results = WriteResults()
+                reason = str(e)
+                for lead in pending:
+                    drain_results.record_failure(lead.name, reason)
+            
+            results.merge(drain_results)
 
 
 def main():
@@ -348,16 +996,16 @@ def main():
         'industry': 'Technology'
     }
     
-    results = scraper.process_lead_batch('linkedin', linkedin_params)
-    print(f"LinkedIn scraping results: {json.dumps(results, indent=2)}")
+    results = asyncio.run(scraper.process_lead_batch('linkedin', linkedin_params))
+    print(f"LinkedIn scraping results: {orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()}")
     
     # Example usage for website scraping
     website_params = {
         'url': 'https://example.com'
     }
     
-    results = scraper.process_lead_batch('website', website_params)
-    print(f"Website scraping results: {json.dumps(results, indent=2)}")
+    results = asyncio.run(scraper.process_lead_batch('website', website_params))
+    print(f"Website scraping results: {orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()}")
 
 
 if __name__ == '__main__':